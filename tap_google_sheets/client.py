@@ -1,7 +1,7 @@
 """REST client handling, including google_sheetsStream base class."""
 
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 import requests
 from singer_sdk.helpers.jsonpath import extract_jsonpath
@@ -12,6 +12,9 @@ from tap_google_sheets.auth import (
     ProxyGoogleSheetsAuthenticator,
 )
 
+if TYPE_CHECKING:
+    from tap_google_sheets.tap import TapGoogleSheets
+
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
 
@@ -23,6 +26,11 @@ class GoogleSheetsBaseStream(RESTStream):
     records_jsonpath = "$[*]"  # Or override `parse_response`.
     next_page_token_jsonpath = "$.next_page"  # Or override `get_next_page_token`.
 
+    def __init__(self, tap: "TapGoogleSheets", **kwargs: Any) -> None:
+        """Initialize the stream, keeping a typed reference to the tap."""
+        self.google_sheets_tap = tap
+        super().__init__(tap=tap, **kwargs)
+
     @property
     def authenticator(self):
         """Return a new authenticator object."""
@@ -54,6 +62,23 @@ class GoogleSheetsBaseStream(RESTStream):
             auth_headers=auth_headers,
         )
 
+    @property
+    def requests_session(self) -> requests.Session:
+        """Return the session of the tap, so connections are reused across streams."""
+        return self.google_sheets_tap.requests_session
+
+    def build_prepared_request(
+        self, *args: Any, **kwargs: Any
+    ) -> requests.PreparedRequest:
+        """Build an authenticated request.
+
+        The authenticator is set on the request rather than on the session, as the
+        session is shared by the streams requested concurrently during discovery.
+        """
+        request = requests.Request(*args, **kwargs)
+        request.auth = self.authenticator
+        return self.requests_session.prepare_request(request)
+
     @property
     def http_headers(self) -> dict:
         """Return the http headers needed."""
@@ -1,15 +1,22 @@
 """Stream type classes for tap-google-sheets."""
 
-import re
-from itertools import zip_longest
+import itertools
+from functools import cached_property
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
+import ijson
 import requests
+from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
 from singer_sdk.helpers.jsonpath import extract_jsonpath
+from urllib3.exceptions import HTTPError
 
 from tap_google_sheets.client import GoogleSheetsBaseStream
-from tap_google_sheets.utils import get_parsed_sheet_id
+from tap_google_sheets.utils import (
+    deduplicate_column_names,
+    get_parsed_sheet_id,
+    normalize_column_name,
+)
 
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
@@ -31,6 +38,28 @@ class GoogleSheetsStream(GoogleSheetsBaseStream):
             path += f"!{sheet_range}"
         return path
 
+    @cached_property
+    def _streaming_session(self) -> requests.Session:
+        """Session streaming the responses, so values are parsed as they download.
+
+        It mounts the adapter of the tap session, so connections are still reused.
+        """
+        session = requests.Session()
+        session.stream = True
+        session.mount("https://", self.google_sheets_tap.requests_session.get_adapter("https://"))
+        return session
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """Return the streaming session."""
+        return self._streaming_session
+
+    def get_next_page_token(
+        self, response: requests.Response, previous_token: Optional[Any]
+    ) -> Optional[Any]:
+        """Return None, as the values API returns the whole range in one response."""
+        return None
+
     def get_selected_columns(self) -> List[str]:
         """Extract selected columns from the metadata catalog.
 
@@ -48,29 +77,107 @@ class GoogleSheetsStream(GoogleSheetsBaseStream):
             if metadata.selected:
                 selected_columns.append(column_name)
 
-        # Normalize the selected columns
-        return list(set(re.sub(r"\s+", "_", col.strip()) for col in selected_columns))
+        # Normalize the selected columns, dropping duplicates but keeping catalog order
+        return list(dict.fromkeys(normalize_column_name(col) for col in selected_columns))
 
-    def parse_response(self, response: requests.Response) -> Iterable[dict]:
-        """Parse response, build response back up into json, update stream schema."""
-        headings, *data = response.json()["values"]
-        data_rows = []
+    @cached_property
+    def _selected_columns_set(self) -> FrozenSet[str]:
+        """Selected columns, cached as the catalog does not change during a sync."""
+        return frozenset(self.get_selected_columns())
 
-        # Normalize column headings to match possible user input
-        normalized_headings = [re.sub(r"\s+", "_", h.strip()) for h in headings]
+    @staticmethod
+    def _iter_items(response: requests.Response) -> Iterator[list]:
+        """Decode the rows of the streamed body incrementally."""
+        response.raw.decode_content = True
+        return ijson.items(response.raw, "values.item")
 
-        selected_columns = self.get_selected_columns()
-        selected_columns_set = set(selected_columns) if selected_columns else set(normalized_headings)
+    def _resume_values(
+        self, headings: Optional[list], rows_read: int
+    ) -> Tuple[requests.Response, Iterator[list]]:
+        """Request the range again, and skip to the first row not yet read.
 
-        # List of true and false based if heading has value and is in selected_columns
-        mask = [bool(x) and re.sub(r"\s+", "_", x.strip()) in selected_columns_set for x in headings]
+        The next row is read here too, so that failures up to it are retried by the
+        request decorator, and each resumed download makes progress.
+        """
+        response = self._request(self.prepare_request(None, None), None)
 
-        # Build up a json like response using the mask to ignore unnamed columns
-        for values in data:
-            data_rows.append(
-                dict(
-                    [(re.sub(r"\s+", "_", h.strip()), v or "") for m, h, v in zip_longest(mask, headings, values) if m]
+        try:
+            items = self._iter_items(response)
+
+            for index, values in enumerate(items):
+                if index == 0 and headings is not None and values != headings:
+                    raise FatalAPIError("The sheet headings changed while it was being downloaded")
+
+                if index >= rows_read:
+                    return response, itertools.chain([values], items)
+
+            return response, iter(())
+        except (HTTPError, ijson.JSONError) as e:
+            response.close()
+            raise RetriableAPIError(f"Response download failed: {e}", response) from e
+
+    def iter_values(self, response: requests.Response) -> Iterable[list]:
+        """Decode the rows of the streamed body incrementally.
+
+        The body is downloaded while rows are yielded, outside of the retried
+        request. If the download fails part way, the range is requested again and
+        the rows already yielded are skipped, as long as the headings are unchanged.
+        """
+        headings: Optional[list] = None
+        rows_read = 0
+        items = self._iter_items(response)
+
+        while True:
+            try:
+                for values in items:
+                    if headings is None:
+                        headings = values
+                    rows_read += 1
+                    yield values
+
+                return
+            except (HTTPError, ijson.JSONError) as e:
+                response.close()
+
+                self.logger.warning(
+                    "Response download failed after %d rows (%s), requesting again",
+                    rows_read,
+                    e,
                 )
-            )
+                response, items = self.request_decorator(self._resume_values)(headings, rows_read)
 
-        yield from extract_jsonpath(self.records_jsonpath, input=data_rows)
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        """Parse response, build response back up into json, update stream schema."""
+        # Decode the streamed body incrementally, rather than loading the whole
+        # sheet into memory before the first record can be emitted
+        data = iter(self.iter_values(response))
+        headings = next(data, None)
+
+        if headings is None:
+            return
+
+        # Normalize column headings to match possible user input, and the schema
+        normalized_headings = deduplicate_column_names(normalize_column_name(h) for h in headings)
+
+        selected_columns_set = self._selected_columns_set or set(normalized_headings)
+
+        # Pair the position of each column that has a heading and is selected with
+        # its heading, so the row loop neither normalizes headings again nor visits
+        # ignored columns
+        selected_idx_name = [
+            (i, nh) for i, (h, nh) in enumerate(zip(headings, normalized_headings)) if h and nh in selected_columns_set
+        ]
+
+        def iter_rows():
+            # Build up a json like response from the selected columns only,
+            # rows may be shorter than the headings when trailing cells are empty
+            for values in data:
+                row_length = len(values)
+                yield {nh: (values[i] or "") if i < row_length else "" for i, nh in selected_idx_name}
+
+        # Stream rows straight through for the default path, rather than holding
+        # every record in memory at once
+        if self.records_jsonpath == "$[*]":
+            yield from iter_rows()
+        else:
+            yield from extract_jsonpath(self.records_jsonpath, input=list(iter_rows()))
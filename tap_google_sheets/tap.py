@@ -1,8 +1,11 @@
 """google_sheets tap class."""
 
 import re
-from functools import cached_property
-from typing import List
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
 import requests
 from singer_sdk import Stream, Tap
@@ -11,22 +14,55 @@ from singer_sdk.exceptions import ConfigValidationError
 
 from tap_google_sheets.client import GoogleSheetsBaseStream
 from tap_google_sheets.streams import GoogleSheetsStream
-from tap_google_sheets.utils import get_parsed_sheet_id
+from tap_google_sheets.utils import (
+    deduplicate_column_names,
+    get_parsed_sheet_id,
+    normalize_column_name,
+)
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+def _compile_a1_regexp(shapes):
+    """Build a single regex matching any of the given A1 notation shapes.
+
+    Each shape is written with ``A`` for a column and ``1`` for a line, e.g.
+    ``"A1:A"``. Group names are suffixed with the index of their shape, since
+    names must be unique across the alternatives.
+    """
+    parts = {"A": ("column", r"[A-Za-z]{1,3}"), "1": ("line", r"\d{1,7}")}
+    alternatives = []
+
+    for i, shape in enumerate(shapes):
+        cells = zip(("start", "end"), shape.split(":"))
+        alternatives.append(
+            ":".join(
+                "".join(f"(?P<{side}_{parts[c][0]}_{i}>{parts[c][1]})" for c in cell)
+                for side, cell in cells
+            )
+        )
+
+    return re.compile(f"^(?:{'|'.join(alternatives)})$")
 
 
 class TapGoogleSheets(Tap):
     """google_sheets tap class."""
 
-    a1_allowed_regexp = [
-        r"^([A-Za-z]{1,3})(\d{1,7})()()$",  # e.g. G8
-        r"^([A-Za-z]{1,3})():([A-Za-z]{1,3})()$",  # e.g. C:G
-        r"^()(\d{1,7}):()(\d{1,7})$",  # e.g. 1:5
-        r"^([A-Za-z]{1,3})(\d{1,7}):()(\d{1,7})$",  # e.g. C1:5
-        r"^([A-Za-z]{1,3})(\d{1,7}):([A-Za-z]{1,3})()$",  # e.g. A1:B
-        r"^([A-Za-z]{1,3})(\d{1,7}):([A-Za-z]{1,3})(\d{1,7})$",  # e.g. C4:G14
-        r"^([A-Za-z]{1,3})():([A-Za-z]{1,3})(\d{1,7})$",  # e.g. A:B5
-        r"^()(\d{1,7}):([A-Za-z]{1,3})(\d{1,7})$",  # e.g. 2:B5
-    ]
+    a1_allowed_shapes = (
+        "A1",  # e.g. G8
+        "A:A",  # e.g. C:G
+        "1:1",  # e.g. 1:5
+        "A1:1",  # e.g. C1:5
+        "A1:A",  # e.g. A1:B
+        "A1:A1",  # e.g. C4:G14
+        "A:A1",  # e.g. A:B5
+        "1:A1",  # e.g. 2:B5
+    )
+    a1_allowed_regexp = _compile_a1_regexp(a1_allowed_shapes)
+    discovery_max_workers = 8
     name = "tap-google-sheets"
 
     per_sheet_config = th.ObjectType(
@@ -91,18 +127,39 @@ class TapGoogleSheets(Tap):
 
     config_jsonschema = base_config.to_dict()
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the tap, with the session and caches used by discovery."""
+        # Discovery runs within the SDK initialization, across threads, so the
+        # caches and the session are created beforehand rather than lazily
+        self._spreadsheet_titles: Dict[str, str] = {}
+        self._sheet_data: Dict[Tuple[str, Tuple[str, ...]], bytes] = {}
+        self._http = requests.Session()
+
+        # The SDK does not provide a hook once the tap is done (sync_all is final),
+        # so close the connections once the tap is garbage collected or at exit
+        weakref.finalize(self, self._http.close)
+
+        super().__init__(*args, **kwargs)
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """Return a session shared by all streams, so connections are reused."""
+        return self._http
+
     def discover_streams(self) -> List[Stream]:
         """Return a list of discovered streams."""
         streams: List[Stream] = []
 
         sheets = self.config.get("sheets") or [self.config]
-        for stream_config in sheets:
-            stream_name = stream_config.get("output_name") or self.get_sheet_name(stream_config)
+        sheets_data = self.get_sheets_data(sheets)
+
+        for stream_config, google_sheet_data in zip(sheets, sheets_data):
+            # The titles were requested along with the sheets data
+            sheet_id = get_parsed_sheet_id(stream_config["sheet_id"])
+            stream_name = stream_config.get("output_name") or self._spreadsheet_titles[sheet_id]
             stream_name = stream_name.replace(" ", "_")
             key_properties = stream_config.get("key_properties", [])
 
-            google_sheet_data = self.get_sheet_data(stream_config)
-
             stream_schema = self.get_schema(google_sheet_data)
 
             child_sheet_name = stream_config.get("child_sheet_name") or self.get_first_visible_child_sheet_name(
@@ -121,33 +178,44 @@ class TapGoogleSheets(Tap):
 
     def get_sheet_name(self, stream_config):
         """Get the name of the spreadsheet."""
+        return self.get_spreadsheet_title(get_parsed_sheet_id(stream_config["sheet_id"]))
+
+    def get_spreadsheet_title(self, sheet_id):
+        """Get the title of the spreadsheet, once per spreadsheet."""
+        if sheet_id in self._spreadsheet_titles:
+            return self._spreadsheet_titles[sheet_id]
+
         config_stream = GoogleSheetsBaseStream(
             tap=self,
             name="config",
             schema={"one": "one"},
-            path="https://www.googleapis.com/drive/v2/files/" + get_parsed_sheet_id(stream_config["sheet_id"]),
+            path="https://www.googleapis.com/drive/v2/files/" + sheet_id,
         )
 
         prepared_request = config_stream.prepare_request(None, None)
 
-        response: requests.Response = config_stream._request(prepared_request, None)
+        decorated_request = config_stream.request_decorator(config_stream._request)
+        response: requests.Response = decorated_request(prepared_request, None)
+
+        title = _json_loads(response.content).get("title")
+        self._spreadsheet_titles[sheet_id] = title
 
-        return response.json().get("title")
+        return title
 
-    def get_schema(self, google_sheet_data: requests.Response):
+    def get_schema(self, google_sheet_data: dict):
         """Build the schema from the data returned by the google sheet."""
-        headings, *data = google_sheet_data.json()["values"]
+        headings = google_sheet_data["values"][0]
 
-        schema = th.PropertiesList()
-        for column in headings:
-            if column:
-                schema.append(th.Property(re.sub(r"\s+", "_", column.strip()), th.StringType))
+        column_names = deduplicate_column_names(normalize_column_name(column) for column in headings if column)
 
-        return schema.to_dict()
+        # Equivalent to a th.PropertiesList of nullable th.StringType properties
+        properties = {column_name: {"type": ["string", "null"]} for column_name in column_names}
 
-    def get_first_visible_child_sheet_name(self, google_sheet_data: requests.Response):
+        return {"type": "object", "properties": properties}
+
+    def get_first_visible_child_sheet_name(self, google_sheet_data: dict):
         """Get the name of the first visible sheet in the google sheet."""
-        sheet_in_sheet_name = google_sheet_data.json()["range"].rsplit("!", 1)[0]
+        sheet_in_sheet_name = google_sheet_data["range"].rsplit("!", 1)[0]
 
         return sheet_in_sheet_name
 
@@ -161,14 +229,18 @@ class TapGoogleSheets(Tap):
         if sheet_range is None:
             return "1:1"
 
-        range_matcher = (re.match(p, sheet_range) for p in cls.a1_allowed_regexp)
+        match = cls.a1_allowed_regexp.match(sheet_range)
+
+        if match is None:
+            raise ConfigValidationError("Invalid A1 notation for range")
 
-        try:
-            match = next(match for match in range_matcher if match)
-        except StopIteration as e:
-            raise ConfigValidationError("Invalid A1 notation for range") from e
+        # only the groups of the matched shape are set, strip their shape index
+        groups = {k.rsplit("_", 1)[0]: v for k, v in match.groupdict().items() if v}
 
-        start_column, start_line, end_column, end_line = match.groups("")
+        start_column = groups.get("start_column", "")
+        start_line = groups.get("start_line", "")
+        end_column = groups.get("end_column", "")
+        end_line = groups.get("end_line", "")
 
         if start_line and end_line:
             line_number = min(int(start_line), int(end_line))
@@ -182,25 +254,68 @@ class TapGoogleSheets(Tap):
 
         return f"{start_column}{line_number}:{end_column}{line_number}"
 
-    def get_sheet_data(self, stream_config):
-        """Get the data from the selected or first visible sheet in the google sheet."""
+    def get_sheets_data(self, sheets):
+        """Get the first line of each sheet, batching the requests per spreadsheet.
+
+        The titles of the spreadsheets are requested alongside, for the sheets
+        without an output name.
+        """
+        sheets_data: List[Optional[dict]] = [None] * len(sheets)
+        ranges_by_sheet_id: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        # A dict rather than a set, so titles are requested in the config order
+        untitled_sheet_ids: Dict[str, None] = {}
+
+        for index, stream_config in enumerate(sheets):
+            sheet_id = get_parsed_sheet_id(stream_config["sheet_id"])
+            sheet_range = stream_config.get("child_sheet_name", "") + "!" + self.get_first_line_range(stream_config)
+            ranges_by_sheet_id[sheet_id].append((index, sheet_range))
+
+            if not stream_config.get("output_name"):
+                untitled_sheet_ids[sheet_id] = None
+
+        def get_indexed_sheet_data(sheet_id):
+            indexes, ranges = zip(*ranges_by_sheet_id[sheet_id])
+            return zip(indexes, self.get_sheet_data(sheet_id, ranges))
+
+        # Spreadsheets are independent of each other, so request them concurrently
+        with ThreadPoolExecutor(max_workers=self.discovery_max_workers) as executor:
+            # The titles are stored by get_spreadsheet_title, for discover_streams
+            titles = executor.map(self.get_spreadsheet_title, untitled_sheet_ids)
+
+            for indexed_sheet_data in executor.map(get_indexed_sheet_data, ranges_by_sheet_id):
+                for index, value_range in indexed_sheet_data:
+                    sheets_data[index] = value_range
+
+            # Raise the errors of the title requests, if any
+            list(titles)
+
+        return sheets_data
+
+    def get_sheet_data(self, sheet_id, ranges):
+        """Get the data of the given ranges in the google sheet, in a single request."""
+        cache_key = (sheet_id, tuple(ranges))
+
+        # the raw response is kept, so that each caller decodes its own copy
+        if cache_key in self._sheet_data:
+            return _json_loads(self._sheet_data[cache_key])["valueRanges"]
+
         config_stream = GoogleSheetsBaseStream(
             tap=self,
             name="config",
             schema={"not": "null"},
             path="https://sheets.googleapis.com/v4/spreadsheets/"
-            + get_parsed_sheet_id(stream_config["sheet_id"])
-            + "/values/"
-            + stream_config.get("child_sheet_name", "")
-            + "!"
-            + self.get_first_line_range(stream_config),
+            + sheet_id
+            + "/values:batchGet?"
+            + urlencode({"ranges": ranges}, doseq=True),
         )
 
         prepared_request = config_stream.prepare_request(None, None)
 
-        response: requests.Response = config_stream._request(prepared_request, None)
+        decorated_request = config_stream.request_decorator(config_stream._request)
+        response: requests.Response = decorated_request(prepared_request, None)
+        self._sheet_data[cache_key] = response.content
 
-        return response
+        return _json_loads(response.content)["valueRanges"]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,204 @@
+"""Tests sheets sharing a spreadsheet are discovered in a single request."""
+
+import threading
+import unittest
+
+import responses
+
+from tap_google_sheets.tap import TapGoogleSheets
+
+SHEET_ID = "1aBcDeFgHiJkLmNoPqRsTuVwXyZ0123456789-_aBcDe"
+
+
+class TestBatchedDiscovery(unittest.TestCase):
+    """Test class for batched discovery of sheets."""
+
+    def setUp(self):
+        self.mock_config = {
+            "oauth_credentials": {
+                "client_id": "123",
+                "client_secret": "123",
+                "refresh_token": "123",
+            },
+            "sheets": [
+                {
+                    "sheet_id": SHEET_ID,
+                    "output_name": "First",
+                    "child_sheet_name": "Sheet One",
+                },
+                {
+                    "sheet_id": SHEET_ID,
+                    "output_name": "Second",
+                    "child_sheet_name": "Sheet Two",
+                    "range": "B3:D",
+                },
+            ],
+        }
+
+        responses.reset()
+
+    @responses.activate()
+    def test_batched_discovery(self):
+        responses.add(
+            responses.POST,
+            "https://oauth2.googleapis.com/token",
+            json={"access_token": "new_token"},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values:batchGet"
+            + "?ranges=Sheet%20One!1:1&ranges=Sheet%20Two!B3:D3",
+            json={
+                "valueRanges": [
+                    {"range": "'Sheet One'!A1:B1", "values": [["Column One"]]},
+                    {"range": "'Sheet Two'!B3:D3", "values": [["Column Two"]]},
+                ]
+            },
+            status=200,
+        )
+
+        streams = list(TapGoogleSheets(config=self.mock_config).streams.values())
+
+        sheet_calls = [
+            call
+            for call in responses.calls
+            if call.request.url.startswith("https://sheets.googleapis.com")
+        ]
+        self.assertEqual(len(sheet_calls), 1)
+
+        self.assertEqual([stream.name for stream in streams], ["First", "Second"])
+        self.assertEqual(
+            [list(stream.schema["properties"]) for stream in streams],
+            [["Column_One"], ["Column_Two"]],
+        )
+
+    @responses.activate()
+    def test_discovery_across_spreadsheets(self):
+        other_sheet_id = SHEET_ID[::-1]
+        self.mock_config["sheets"].insert(
+            1, {"sheet_id": other_sheet_id, "output_name": "Other"}
+        )
+
+        responses.add(
+            responses.POST,
+            "https://oauth2.googleapis.com/token",
+            json={"access_token": "new_token"},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values:batchGet"
+            + "?ranges=Sheet%20One!1:1&ranges=Sheet%20Two!B3:D3",
+            json={
+                "valueRanges": [
+                    {"range": "'Sheet One'!A1:B1", "values": [["Column One"]]},
+                    {"range": "'Sheet Two'!B3:D3", "values": [["Column Two"]]},
+                ]
+            },
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{other_sheet_id}"
+            + "/values:batchGet?ranges=!1:1",
+            json={"valueRanges": [{"range": "Sheet1!A1:B1", "values": [["Other"]]}]},
+            status=200,
+        )
+
+        streams = list(TapGoogleSheets(config=self.mock_config).streams.values())
+
+        self.assertEqual(
+            [(stream.name, stream.child_sheet_name) for stream in streams],
+            [("First", "Sheet One"), ("Other", "Sheet1"), ("Second", "Sheet Two")],
+        )
+        self.assertEqual(
+            [list(stream.schema["properties"]) for stream in streams],
+            [["Column_One"], ["Other"], ["Column_Two"]],
+        )
+
+    @responses.activate()
+    def test_spreadsheet_requested_once(self):
+        for sheet in self.mock_config["sheets"]:
+            del sheet["output_name"]
+
+        responses.add(
+            responses.POST,
+            "https://oauth2.googleapis.com/token",
+            json={"access_token": "new_token"},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://www.googleapis.com/drive/v2/files/{SHEET_ID}",
+            json={"title": "File Name"},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values:batchGet"
+            + "?ranges=Sheet%20One!1:1&ranges=Sheet%20Two!B3:D3",
+            json={
+                "valueRanges": [
+                    {"range": "'Sheet One'!A1:B1", "values": [["Column One"]]},
+                    {"range": "'Sheet Two'!B3:D3", "values": [["Column Two"]]},
+                ]
+            },
+            status=200,
+        )
+
+        tap = TapGoogleSheets(config=self.mock_config)
+        tap.discover_streams()
+
+        api_calls = [
+            call
+            for call in responses.calls
+            if not call.request.url.startswith("https://oauth2.googleapis.com")
+        ]
+
+        # the title and data are requested once, even across repeated discovery
+        self.assertEqual(len(api_calls), 2)
+
+    @responses.activate()
+    def test_titles_requested_concurrently(self):
+        other_sheet_id = SHEET_ID[::-1]
+        self.mock_config["sheets"] = [
+            {"sheet_id": SHEET_ID},
+            {"sheet_id": other_sheet_id},
+        ]
+        title_threads = []
+
+        def title_callback(title):
+            def callback(request):
+                title_threads.append(threading.current_thread())
+                return 200, {}, '{"title": "%s"}' % title
+
+            return callback
+
+        responses.add(
+            responses.POST,
+            "https://oauth2.googleapis.com/token",
+            json={"access_token": "new_token"},
+            status=200,
+        ),
+        for sheet_id, title in [(SHEET_ID, "File One"), (other_sheet_id, "File Two")]:
+            responses.add_callback(
+                responses.GET,
+                f"https://www.googleapis.com/drive/v2/files/{sheet_id}",
+                callback=title_callback(title),
+            ),
+            responses.add(
+                responses.GET,
+                f"https://sheets.googleapis.com/v4/spreadsheets/{sheet_id}"
+                + "/values:batchGet?ranges=!1:1",
+                json={"valueRanges": [{"range": "Sheet1!A1:B1", "values": [["A"]]}]},
+                status=200,
+            )
+
+        streams = list(TapGoogleSheets(config=self.mock_config).streams.values())
+
+        self.assertEqual([stream.name for stream in streams], ["File_One", "File_Two"])
+
+        # Assert the titles are requested by the thread pool, not one at a time
+        self.assertEqual(len(title_threads), 2)
+        self.assertNotIn(threading.main_thread(), title_threads)
@@ -48,11 +48,15 @@ class TestChildSheetNameSetting(unittest.TestCase):
         ),
         responses.add(
             responses.GET,
-            "https://sheets.googleapis.com/v4/spreadsheets/12345/values/"
+            "https://sheets.googleapis.com/v4/spreadsheets/12345/values:batchGet?ranges="
             + "Test%20Sheet!1:1",
             json={
-                "range": "Test%20Sheet!1:1",
-                "values": [["Column One", "Column Two"]],
+                "valueRanges": [
+                    {
+                        "range": "Test%20Sheet!1:1",
+                        "values": [["Column One", "Column Two"]],
+                    }
+                ]
             },
             status=200,
         ),
@@ -35,8 +35,12 @@ class TestCore(unittest.TestCase):
         ),
         responses.add(
             responses.GET,
-            "https://sheets.googleapis.com/v4/spreadsheets/12345/values/!1:1",
-            json={"range": "Sheet1!1:1", "values": [["column_one", "column_two"]]},
+            "https://sheets.googleapis.com/v4/spreadsheets/12345/values:batchGet?ranges=!1:1",
+            json={
+                "valueRanges": [
+                    {"range": "Sheet1!1:1", "values": [["column_one", "column_two"]]}
+                ]
+            },
             status=200,
         )
 
@@ -63,8 +67,12 @@ class TestCore(unittest.TestCase):
         ),
         responses.add(
             responses.GET,
-            "https://sheets.googleapis.com/v4/spreadsheets/12345/values/!1:1",
-            json={"range": "Sheet1!1:1", "values": [["column_one", "column_two"]]},
+            "https://sheets.googleapis.com/v4/spreadsheets/12345/values:batchGet?ranges=!1:1",
+            json={
+                "valueRanges": [
+                    {"range": "Sheet1!1:1", "values": [["column_one", "column_two"]]}
+                ]
+            },
             status=200,
         ),
         responses.add(
@@ -0,0 +1,103 @@
+import unittest
+
+import responses
+import singer_sdk._singerlib as singer
+import singer_sdk.io_base as io
+
+import tap_google_sheets.tests.utils as test_utils
+from tap_google_sheets.utils import deduplicate_column_names, normalize_column_name
+
+SHEET_ID = "1aBcDeFgHiJkLmNoPqRsTuVwXyZ0123456789-_aBcDe"
+
+
+class TestDuplicateColumnNames(unittest.TestCase):
+    def setUp(self):
+        self.mock_config = {
+            "oauth_credentials": {
+                "client_id": "123",
+                "client_secret": "123",
+                "refresh_token": "123",
+            },
+            "sheet_id": SHEET_ID,
+            "output_name": "sheet",
+        }
+
+        responses.reset()
+        del test_utils.SINGER_MESSAGES[:]
+
+        io.singer_write_message = test_utils.accumulate_singer_messages
+
+    def test_deduplicate_column_names(self):
+        """Test repeated column names are suffixed."""
+        test_pairs = [
+            (["a", "b"], ["a", "b"]),
+            (["a", "a", "a"], ["a", "a_2", "a_3"]),
+            (["a", "", "a", ""], ["a", "", "a_2", ""]),
+            (["a", "a", "a_2"], ["a", "a_2", "a_2_2"]),
+        ]
+        for test_input, expected in test_pairs:
+            self.assertEqual(expected, deduplicate_column_names(test_input))
+
+    def test_normalized_duplicate_column_names(self):
+        """Test columns that collide once normalized are all kept."""
+        headings = ["Foo Bar", "", "Foo_Bar", " Foo  Bar "]
+        column_names = deduplicate_column_names(
+            normalize_column_name(column) for column in headings if column
+        )
+        self.assertEqual(["Foo_Bar", "Foo_Bar_2", "Foo_Bar_3"], column_names)
+
+    @responses.activate()
+    def test_records_duplicate_column_names(self):
+        """Test records of colliding, unnamed and short rows match the schema."""
+        headings = ["Foo Bar", "", "Foo_Bar", " Foo  Bar ", "Other"]
+
+        responses.add(
+            responses.POST,
+            "https://oauth2.googleapis.com/token",
+            json={"access_token": "new_token"},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values:batchGet"
+            + "?ranges=!1:1",
+            json={"valueRanges": [{"range": "Sheet1!1:1", "values": [headings]}]},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values/Sheet1",
+            json={
+                "range": "Sheet1",
+                "values": [
+                    headings,
+                    ["1", "unnamed", "2", "3", "4"],
+                    ["5"],
+                    ["6", "", "7"],
+                ],
+            },
+            status=200,
+        )
+
+        tap = test_utils.set_up_tap_with_custom_catalog(self.mock_config, ["sheet"])
+
+        tap.sync_all()
+
+        schema_keys = list(tap.streams["sheet"].schema["properties"])
+        records = [
+            message.record
+            for message in test_utils.SINGER_MESSAGES
+            if isinstance(message, singer.RecordMessage)
+        ]
+
+        self.assertEqual(["Foo_Bar", "Foo_Bar_2", "Foo_Bar_3", "Other"], schema_keys)
+        for record in records:
+            self.assertEqual(schema_keys, list(record))
+        self.assertEqual(
+            [
+                {"Foo_Bar": "1", "Foo_Bar_2": "2", "Foo_Bar_3": "3", "Other": "4"},
+                {"Foo_Bar": "5", "Foo_Bar_2": "", "Foo_Bar_3": "", "Other": ""},
+                {"Foo_Bar": "6", "Foo_Bar_2": "7", "Foo_Bar_3": "", "Other": ""},
+            ],
+            records,
+        )
@@ -45,8 +45,15 @@ class TestIgnoringUnnamedColumns(unittest.TestCase):
         ),
         responses.add(
             responses.GET,
-            "https://sheets.googleapis.com/v4/spreadsheets/12345/values/!1:1",
-            json={"range": "Sheet1!1:1", "values": [["Column_One", "", "Column_Two"]]},
+            "https://sheets.googleapis.com/v4/spreadsheets/12345/values:batchGet?ranges=!1:1",
+            json={
+                "valueRanges": [
+                    {
+                        "range": "Sheet1!1:1",
+                        "values": [["Column_One", "", "Column_Two"]],
+                    }
+                ]
+            },
             status=200,
         ),
         responses.add(
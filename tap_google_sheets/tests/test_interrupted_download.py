@@ -0,0 +1,171 @@
+"""Tests an interrupted download of the sheet values is requested again."""
+
+import unittest
+from unittest import mock
+
+import backoff
+import responses
+import singer_sdk._singerlib as singer
+import singer_sdk.io_base as io
+from singer_sdk.exceptions import FatalAPIError
+
+import tap_google_sheets.tests.utils as test_utils
+from tap_google_sheets.streams import GoogleSheetsStream
+
+SHEET_ID = "1aBcDeFgHiJkLmNoPqRsTuVwXyZ0123456789-_aBcDe"
+
+
+class TestInterruptedDownload(unittest.TestCase):
+    """Test class for interrupted downloads."""
+
+    def setUp(self):
+        self.mock_config = {
+            "oauth_credentials": {
+                "client_id": "123",
+                "client_secret": "123",
+                "refresh_token": "123",
+            },
+            "sheet_id": SHEET_ID,
+            "output_name": "sheet",
+        }
+
+        responses.reset()
+        del test_utils.SINGER_MESSAGES[:]
+
+        io.singer_write_message = test_utils.accumulate_singer_messages
+
+    @responses.activate()
+    def test_interrupted_download(self):
+        responses.add(
+            responses.POST,
+            "https://oauth2.googleapis.com/token",
+            json={"access_token": "new_token"},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values:batchGet"
+            + "?ranges=!1:1",
+            json={"valueRanges": [{"range": "Sheet1!1:1", "values": [["Column"]]}]},
+            status=200,
+        ),
+        # the first response is cut off after the second row
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values/Sheet1",
+            body='{"range": "Sheet1", "values": [["Column"], ["1"], ["2"], ["',
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values/Sheet1",
+            json={"range": "Sheet1", "values": [["Column"], ["1"], ["2"], ["3"]]},
+            status=200,
+        )
+
+        tap = test_utils.set_up_tap_with_custom_catalog(self.mock_config, ["sheet"])
+
+        tap.sync_all()
+
+        records = [
+            message.record
+            for message in test_utils.SINGER_MESSAGES
+            if isinstance(message, singer.RecordMessage)
+        ]
+
+        # Assert that the rows already synced are not synced again
+        self.assertEqual(records, [{"Column": "1"}, {"Column": "2"}, {"Column": "3"}])
+
+    @responses.activate()
+    def test_interrupted_resumed_download(self):
+        responses.add(
+            responses.POST,
+            "https://oauth2.googleapis.com/token",
+            json={"access_token": "new_token"},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values:batchGet"
+            + "?ranges=!1:1",
+            json={"valueRanges": [{"range": "Sheet1!1:1", "values": [["Column"]]}]},
+            status=200,
+        ),
+        # the first response is cut off after the first row
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values/Sheet1",
+            body='{"range": "Sheet1", "values": [["Column"], ["1"], ["',
+            status=200,
+        ),
+        # the response requested again is cut off before reaching new rows
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values/Sheet1",
+            body='{"range": "Sheet1", "values": [["Column"], ["1"], ["',
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values/Sheet1",
+            json={"range": "Sheet1", "values": [["Column"], ["1"], ["2"]]},
+            status=200,
+        )
+
+        tap = test_utils.set_up_tap_with_custom_catalog(self.mock_config, ["sheet"])
+
+        # Retry without waiting
+        with mock.patch.multiple(
+            GoogleSheetsStream,
+            backoff_wait_generator=lambda self: backoff.constant(interval=0),
+            backoff_jitter=lambda self, value: value,
+        ):
+            tap.sync_all()
+
+        records = [
+            message.record
+            for message in test_utils.SINGER_MESSAGES
+            if isinstance(message, singer.RecordMessage)
+        ]
+        values_calls = [
+            call for call in responses.calls if "/values/" in call.request.url
+        ]
+
+        # Assert the download requested again is retried by the same backoff
+        self.assertEqual(records, [{"Column": "1"}, {"Column": "2"}])
+        self.assertEqual(len(values_calls), 3)
+
+    @responses.activate()
+    def test_interrupted_download_headings_changed(self):
+        responses.add(
+            responses.POST,
+            "https://oauth2.googleapis.com/token",
+            json={"access_token": "new_token"},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values:batchGet"
+            + "?ranges=!1:1",
+            json={"valueRanges": [{"range": "Sheet1!1:1", "values": [["Column"]]}]},
+            status=200,
+        ),
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values/Sheet1",
+            body='{"range": "Sheet1", "values": [["Column"], ["1"], ["',
+            status=200,
+        ),
+        # a column was inserted before the range was requested again
+        responses.add(
+            responses.GET,
+            f"https://sheets.googleapis.com/v4/spreadsheets/{SHEET_ID}/values/Sheet1",
+            json={"range": "Sheet1", "values": [["New", "Column"], ["0", "1"]]},
+            status=200,
+        )
+
+        tap = test_utils.set_up_tap_with_custom_catalog(self.mock_config, ["sheet"])
+
+        # Assert the rows are not mapped to the previous headings
+        with self.assertRaises(FatalAPIError):
+            tap.sync_all()
@@ -40,10 +40,14 @@ class TestKeyPropertiesSetting(unittest.TestCase):
         ),
         responses.add(
             responses.GET,
-            "https://sheets.googleapis.com/v4/spreadsheets/12345/values/!1:1",
+            "https://sheets.googleapis.com/v4/spreadsheets/12345/values:batchGet?ranges=!1:1",
             json={
-                "range": "!1:1",
-                "values": [["Column One", "Column Two"]],
+                "valueRanges": [
+                    {
+                        "range": "!1:1",
+                        "values": [["Column One", "Column Two"]],
+                    }
+                ]
             },
             status=200,
         )
@@ -40,8 +40,12 @@ class TestOutputNameSetting(unittest.TestCase):
         ),
         responses.add(
             responses.GET,
-            "https://sheets.googleapis.com/v4/spreadsheets/12345/values/!1:1",
-            json={"range": "Sheet1!1:1", "values": [["Column One", "Column Two"]]},
+            "https://sheets.googleapis.com/v4/spreadsheets/12345/values:batchGet?ranges=!1:1",
+            json={
+                "valueRanges": [
+                    {"range": "Sheet1!1:1", "values": [["Column One", "Column Two"]]}
+                ]
+            },
             status=200,
         ),
         responses.add(
@@ -53,8 +53,15 @@ class TestUnderscoringColumnNamed(unittest.TestCase):
         ),
         responses.add(
             responses.GET,
-            "https://sheets.googleapis.com/v4/spreadsheets/12345/values/!1:1",
-            json={"range": "Sheet1!1:1", "values": [self.column_response["values"][0]]},
+            "https://sheets.googleapis.com/v4/spreadsheets/12345/values:batchGet?ranges=!1:1",
+            json={
+                "valueRanges": [
+                    {
+                        "range": "Sheet1!1:1",
+                        "values": [self.column_response["values"][0]],
+                    }
+                ]
+            },
             status=200,
         ),
         responses.add(
@@ -1,15 +1,46 @@
 import re
+from typing import Dict, Iterable, List
 
+whitespace_regexp = re.compile(r"\s+")
 
-def get_parsed_sheet_id(input_string: str) -> str:
-    pattern = r"/d/([a-zA-Z0-9-_]+)"
+# A valid spreadsheet ID is assumed to be between 40-50 characters long
+sheet_id_regexp = re.compile(r"[a-zA-Z0-9-_]{40,50}")
+sheet_url_regexp = re.compile(r"/d/([a-zA-Z0-9-_]+)")
 
-    # Check if the input is a valid spreadsheet ID (assuming a valid ID is between 40-50 characters long)
-    if re.fullmatch(r"[a-zA-Z0-9-_]{40,50}", input_string):
-        return input_string
 
-    match = re.search(pattern, input_string)
-    if match:
-        return match.group(1)
+def get_parsed_sheet_id(input_string: str) -> str:
+    # Only a URL can contain "/d/", a bare ID never does
+    if "/d/" not in input_string:
+        if sheet_id_regexp.fullmatch(input_string):
+            return input_string
     else:
-        raise RuntimeError(f"Spreadsheet ID not found in the input: {input_string}.")
+        match = sheet_url_regexp.search(input_string)
+        if match:
+            return match.group(1)
+
+    raise RuntimeError(f"Spreadsheet ID not found in the input: {input_string}.")
+
+
+def normalize_column_name(column_name: str) -> str:
+    """Strip a column name and replace any inner whitespace with underscores."""
+    return whitespace_regexp.sub("_", column_name.strip())
+
+
+def deduplicate_column_names(column_names: Iterable[str]) -> List[str]:
+    """Suffix repeated column names with _2, _3, etc. so that every name is unique.
+
+    Empty names are left as they are, as unnamed columns are ignored.
+    """
+    counts: Dict[str, int] = {}
+    unique_names = []
+
+    for name in column_names:
+        unique_name = name
+        if name:
+            while unique_name in counts:
+                counts[name] += 1
+                unique_name = f"{name}_{counts[name]}"
+            counts[unique_name] = 1
+        unique_names.append(unique_name)
+
+    return unique_names